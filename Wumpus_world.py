@@ -3,22 +3,54 @@ from datetime import datetime
 from collections import deque
 import time
 
+# Static title block for the board, built once instead of on every redraw
+BOARD_BANNER = "\n" + "=" * 70 + "\n" + " " * 18 + "WUMPUS WORLD\n" + "=" * 70 + "\n\n"
+
+# Static rules framing the status section
+STATUS_TOP = "\n" + "=" * 70 + "\n"
+STATUS_RULE = "-" * 70 + "\n"
+
+# Menu text is static, so it is built once by show_menu() and reused
+_menu_text = None
+
+# Gold/arrow/wumpus status line for every (has_gold, arrow_used, wumpus_alive)
+STATUS_BADGES = {
+    (has_gold, arrow_used, wumpus_alive):
+        f"Gold: {'GRABBED' if has_gold else 'SEARCHING'} | "
+        f"Arrow: {'USED' if arrow_used else 'READY'} | "
+        f"Wumpus: {'DEAD' if not wumpus_alive else 'ALIVE'}\n"
+    for has_gold in (False, True)
+    for arrow_used in (False, True)
+    for wumpus_alive in (False, True)
+}
+
+# Menu choice -> grid size
+DIFFICULTY_LEVELS = {
+    1: 4,
+    2: 8,
+    3: 16
+}
+
+# Direction vector -> readable name lookup table
+DIRECTION_NAMES = {
+    (-1, 0): "UP",
+    (1, 0): "DOWN",
+    (0, -1): "LEFT",
+    (0, 1): "RIGHT"
+}
+
+
 def get_direction_name(dx, dy):
     """Convert direction vector to readable direction"""
-    if dx == -1 and dy == 0:
-        return "UP"
-    elif dx == 1 and dy == 0:
-        return "DOWN"
-    elif dx == 0 and dy == -1:
-        return "LEFT"
-    elif dx == 0 and dy == 1:
-        return "RIGHT"
-    return "UNKNOWN"
+    return DIRECTION_NAMES.get((dx, dy), "UNKNOWN")
 
 
 class WumpusAIAgent:
     """AI Agent - MUST find and grab gold - NO SURRENDER - INFINITE MOVES"""
     
+    __slots__ = ('game', 'confirmed_safe', 'confirmed_dangerous', 'explored',
+                 'pit_locations', 'wumpus_location', 'move_history')
+    
     def __init__(self, game):
         self.game = game
         self.confirmed_safe = set()
@@ -42,15 +74,10 @@ class WumpusAIAgent:
         has_breeze = "Breeze" in percepts
         has_stench = "Stench" in percepts
         
-        # If no breeze, adjacent cells are DEFINITELY safe from pits
-        if not has_breeze:
-            for cell in adjacent_cells:
-                self.confirmed_safe.add(cell)
-        
-        # If no stench, adjacent cells are DEFINITELY safe from wumpus
-        if not has_stench:
-            for cell in adjacent_cells:
-                self.confirmed_safe.add(cell)
+        # If no breeze, adjacent cells are DEFINITELY safe from pits;
+        # if no stench, adjacent cells are DEFINITELY safe from wumpus
+        if not (has_breeze and has_stench):
+            self.confirmed_safe.update(adjacent_cells)
     
     def update_pit_knowledge(self, pit_pos):
         """Update when we discover a pit"""
@@ -62,27 +89,20 @@ class WumpusAIAgent:
         current_pos = self.game.agent_pos
         
         # Get all unexplored cells
-        all_cells = set()
-        for x in range(1, self.game.grid_size + 1):
-            for y in range(1, self.game.grid_size + 1):
-                all_cells.add((x, y))
-        
-        unexplored = all_cells - self.explored
+        unexplored = self.game.all_cells - self.explored
         
         # First try confirmed safe unexplored
         safe_unexplored = unexplored & self.confirmed_safe
         if safe_unexplored:
             # Pick any one
-            target = safe_unexplored.pop()
-            safe_unexplored.add(target)  # Add back for later
+            target = next(iter(safe_unexplored))
             return self._bfs_path(current_pos, target)
         
         # If no confirmed safe unexplored, try risky unexplored
         # (not confirmed dangerous)
         risky_unexplored = unexplored - self.confirmed_dangerous
         if risky_unexplored:
-            target = risky_unexplored.pop()
-            risky_unexplored.add(target)  # Add back
+            target = next(iter(risky_unexplored))
             return self._bfs_path(current_pos, target)
         
         return []
@@ -92,20 +112,28 @@ class WumpusAIAgent:
         if start == goal:
             return []
         
-        queue = deque([(start, [start])])
-        visited = {start}
+        # Track each cell's predecessor instead of copying a path per node
+        queue = deque([start])
+        parent = {start: None}
+        
+        adjacent = self.game.adjacent
+        dangerous = self.confirmed_dangerous
         
         while queue:
-            current, path = queue.popleft()
+            current = queue.popleft()
             
             if current == goal:
-                return path[1:] if len(path) > 1 else []
+                path = []
+                while current != start:
+                    path.append(current)
+                    current = parent[current]
+                path.reverse()
+                return path
             
-            for next_pos in self.game.adjacent(current):
-                if (next_pos not in visited and 
-                    next_pos not in self.confirmed_dangerous):
-                    visited.add(next_pos)
-                    queue.append((next_pos, path + [next_pos]))
+            for next_pos in adjacent(current):
+                if next_pos not in parent and next_pos not in dangerous:
+                    parent[next_pos] = current
+                    queue.append(next_pos)
         
         return []
     
@@ -147,10 +175,11 @@ class WumpusAIAgent:
         
         # Priority 3: Kill Wumpus if adjacent
         if has_stench and not self.game.arrow_used:
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                adj_pos = (current_pos[0] + dx, current_pos[1] + dy)
-                if self.game.wumpus_alive and adj_pos == self.game.wumpus:
-                    return ('fire', (dx, dy))
+            wumpus = self.game.wumpus
+            if self.game.wumpus_alive and wumpus in self.game.adjacent(current_pos):
+                dx = wumpus[0] - current_pos[0]
+                dy = wumpus[1] - current_pos[1]
+                return ('fire', (dx, dy))
         
         # Priority 4: KEEP EXPLORING - NEVER GIVE UP - INFINITE MOVES
         # Try to find unexplored cells
@@ -162,17 +191,13 @@ class WumpusAIAgent:
             # Check for loop and skip if needed
             if self.detect_loop(next_pos):
                 # Try to find alternative path
-                all_cells = set()
-                for x in range(1, self.game.grid_size + 1):
-                    for y in range(1, self.game.grid_size + 1):
-                        all_cells.add((x, y))
-                
-                unexplored = all_cells - self.explored
+                unexplored = self.game.all_cells - self.explored
                 unexplored_safe = unexplored - self.confirmed_dangerous
                 
                 # Find any unexplored that's NOT in our loop
+                loop_cells = (self.move_history[0], self.move_history[1])
                 for target in unexplored_safe:
-                    if target not in [self.move_history[0], self.move_history[1]]:
+                    if target not in loop_cells:
                         alt_path = self._bfs_path(current_pos, target)
                         if alt_path:
                             next_pos = alt_path[0]
@@ -198,18 +223,60 @@ class WumpusAIAgent:
 
 
 class WumpusWorld:
+    __slots__ = ('grid_size', 'num_pits', 'game_state', 'score_history',
+                 'last_percepts', 'ai_agent', 'move_count', 'max_moves',
+                 'score', 'agent_pos', 'agent_alive', 'has_gold',
+                 'wumpus_alive', 'arrow_used', 'visited', 'scored_cells',
+                 'message', 'wumpus', 'gold', 'pits', 'all_cells', '_adj',
+                 '_board_header', '_row_labels', '_row_separator',
+                 '_percepts_key', '_percepts_cache', '_status_key',
+                 '_status_text')
+
     def __init__(self, grid_size=6):
         self.grid_size = grid_size
         self.num_pits = grid_size
         self.game_state = "PLAYING"
         self.score_history = []
         self.last_percepts = []
+        self._build_board_frame()
+        self._build_adjacency()
         self._init_board()
         self.ai_agent = None
         self.move_count = 0
         self.max_moves = float('inf')  # INFINITE MOVES
         self.score = 0
 
+    def _build_board_frame(self):
+        """Precompute the static header, row labels and separator of the board"""
+        header = ["   "]
+        for col in range(1, self.grid_size + 1):
+            if col < 10:
+                header.append(f"  {col}  ")
+            else:
+                header.append(f" {col:2} ")
+        header.append("\n")
+        self._board_header = "".join(header)
+        self._row_labels = [f"{row:2} |" if row < 10 else f"{row:2}|"
+                            for row in range(1, self.grid_size + 1)]
+        self._row_separator = "  +" + "+".join(["---"] * self.grid_size) + "+\n"
+
+    def _build_adjacency(self):
+        """Precompute every cell and its in-bounds neighbours once per game"""
+        self._adj = {}
+        for x in range(1, self.grid_size + 1):
+            for y in range(1, self.grid_size + 1):
+                nb = []
+                if x > 1:
+                    nb.append((x - 1, y))
+                if x < self.grid_size:
+                    nb.append((x + 1, y))
+                if y > 1:
+                    nb.append((x, y - 1))
+                if y < self.grid_size:
+                    nb.append((x, y + 1))
+                self._adj[(x, y)] = tuple(nb)
+        self.all_cells = frozenset(self._adj)
+
     def _init_board(self):
         self.agent_pos = (random.randint(1, self.grid_size), 
                          random.randint(1, self.grid_size))
@@ -223,38 +290,35 @@ class WumpusWorld:
         self.score = 0
         self.score_history = []
         self.last_percepts = []
+        self._percepts_key = None
+        self._percepts_cache = ()
+        self._status_key = None
+        self._status_text = ""
 
-        self.wumpus = self._rand(exclude=[self.agent_pos])
-        self.gold = self._rand(exclude=[self.agent_pos, self.wumpus])
-        self.pits = []
-        for _ in range(self.num_pits):
-            p = self._rand(exclude=[self.agent_pos, self.wumpus, self.gold] + self.pits)
-            self.pits.append(p)
-
-    def _rand(self, exclude=[]):
-        while True:
-            c = (random.randint(1, self.grid_size), random.randint(1, self.grid_size))
-            if c not in exclude:
-                return c
+        # Draw wumpus, gold and pits in one collision-free sample
+        free_cells = [(x, y)
+                      for x in range(1, self.grid_size + 1)
+                      for y in range(1, self.grid_size + 1)
+                      if (x, y) != self.agent_pos]
+        picks = random.sample(free_cells, 2 + self.num_pits)
+        self.wumpus, self.gold = picks[0], picks[1]
+        self.pits = frozenset(picks[2:])
 
     def adjacent(self, pos):
-        x, y = pos
-        nb = []
-        if x > 1:
-            nb.append((x - 1, y))
-        if x < self.grid_size:
-            nb.append((x + 1, y))
-        if y > 1:
-            nb.append((x, y - 1))
-        if y < self.grid_size:
-            nb.append((x, y + 1))
-        return nb
+        return self._adj[pos]
 
     def percepts(self):
-        """Generate perceptions based on current position"""
+        """Generate perceptions based on current position (cached per state)"""
+        key = (self.agent_pos, self.wumpus_alive, self.has_gold)
+        if key != self._percepts_key:
+            self._percepts_cache = tuple(self._compute_percepts())
+            self._percepts_key = key
+        return self._percepts_cache
+
+    def _compute_percepts(self):
         p = []
         
-        if any(pit in self.adjacent(self.agent_pos) for pit in self.pits):
+        if not self.pits.isdisjoint(self.adjacent(self.agent_pos)):
             p.append("Breeze")
         
         if self.wumpus_alive and self.wumpus in self.adjacent(self.agent_pos):
@@ -279,23 +343,20 @@ class WumpusWorld:
         self.arrow_used = True
         self._add_score(-50, "Arrow fired")
         
+        # The arrow flies in a straight line, so it hits exactly when the
+        # wumpus lies ahead of the agent on that line - no need to walk it
         r, c = self.agent_pos
-        hit = False
-        while True:
-            r += dr
-            c += dc
-            if not (1 <= r <= self.grid_size and 1 <= c <= self.grid_size):
-                self.message = "Arrow missed!"
-                break
-            if self.wumpus_alive and (r, c) == self.wumpus:
-                self.wumpus_alive = False
-                self._add_score(300, "Wumpus slain")
-                self.message = "Wumpus slain!"
-                self.last_percepts = ["SCREAM!!!"]
-                hit = True
-                break
-        
-        if not hit:
+        wr, wc = self.wumpus
+        on_line = (wr - r) * dc == (wc - c) * dr
+        ahead = (wr - r) * dr + (wc - c) * dc > 0
+        
+        if self.wumpus_alive and on_line and ahead:
+            self.wumpus_alive = False
+            self._add_score(300, "Wumpus slain")
+            self.message = "Wumpus slain!"
+            self.last_percepts = ["SCREAM!!!"]
+        else:
+            self.message = "Arrow missed!"
             self.last_percepts = []
 
     def move(self, dx, dy):
@@ -358,77 +419,92 @@ class WumpusWorld:
         self.move_count = 0
 
 
+def _status_block(game):
+    """Status section of the board, rebuilt only when its contents change"""
+    key = (game.agent_pos, game.score, tuple(game.last_percepts), game.has_gold,
+           game.arrow_used, game.wumpus_alive, game.message)
+    if key == game._status_key:
+        return game._status_text
+    
+    output = [STATUS_TOP]
+    output.append(f"Position: ({game.agent_pos[0]},{game.agent_pos[1]}) | Score: {game.score}\n")
+    output.append(STATUS_RULE)
+    
+    if game.last_percepts:
+        output.append(f"PERCEPTS: {', '.join(game.last_percepts)}\n")
+    else:
+        output.append("PERCEPTS: None\n")
+    
+    output.append(STATUS_BADGES[(game.has_gold, game.arrow_used, game.wumpus_alive)])
+    output.append(STATUS_RULE)
+    
+    if game.message:
+        output.append(f">>> {game.message}\n")
+    output.append(STATUS_RULE)
+    
+    game._status_key = key
+    game._status_text = "".join(output)
+    return game._status_text
+
+
 def display_board(game, show_details=True):
     """Display game board"""
-    output = []
-    output.append("\n")
-    output.append("=" * 70 + "\n")
-    output.append(" " * 18 + "WUMPUS WORLD\n")
-    output.append("=" * 70 + "\n\n")
+    output = [BOARD_BANNER]
     
     # Grid header
-    output.append("   ")
-    for col in range(1, game.grid_size + 1):
-        if col < 10:
-            output.append(f"  {col}  ")
-        else:
-            output.append(f" {col:2} ")
-    output.append("\n")
+    output.append(game._board_header)
+    
+    # Bind per-cell lookups to locals for the inner loop
+    agent_pos = game.agent_pos
+    gold = None if game.has_gold else game.gold  # grabbed gold is not drawn
+    wumpus = game.wumpus
+    wumpus_alive = game.wumpus_alive
+    pits = game.pits
+    visited = game.visited
+    cols = range(1, game.grid_size + 1)
     
     # Grid rows
-    for row in range(1, game.grid_size + 1):
-        if row < 10:
-            output.append(f"{row:2} |")
-        else:
-            output.append(f"{row:2}|")
+    for row, label in zip(cols, game._row_labels):
+        output.append(label)
+        symbols = []
         
-        for col in range(1, game.grid_size + 1):
+        for col in cols:
             cell = (row, col)
-            symbol = "   "
             
-            if cell == game.agent_pos:
+            if cell == agent_pos:
                 symbol = " K "
-            elif cell == game.gold and not game.has_gold:
+            elif cell == gold:
                 symbol = " G "
-            elif cell == game.wumpus and game.wumpus_alive:
-                symbol = " W "
-            elif cell == game.wumpus and not game.wumpus_alive:
-                symbol = " X "
-            elif cell in game.pits:
+            elif cell == wumpus:
+                symbol = " W " if wumpus_alive else " X "
+            elif cell in pits:
                 symbol = " P "
-            elif cell in game.visited:
+            elif cell in visited:
                 symbol = " . "
             else:
                 symbol = " ? "
             
-            output.append(symbol + "|")
-        output.append("\n")
-        output.append("  +" + "+".join(["---" for _ in range(game.grid_size)]) + "+\n")
+            symbols.append(symbol)
+        
+        # Emit the whole row in one piece instead of one fragment per cell
+        output.append("|".join(symbols) + "|\n")
+        output.append(game._row_separator)
     
     if show_details:
-        # Status
-        output.append("\n" + "=" * 70 + "\n")
-        output.append(f"Position: ({game.agent_pos[0]},{game.agent_pos[1]}) | Score: {game.score}\n")
-        output.append("-" * 70 + "\n")
-        
-        if game.last_percepts:
-            output.append(f"PERCEPTS: {', '.join(game.last_percepts)}\n")
-        else:
-            output.append("PERCEPTS: None\n")
-        
-        output.append(f"Gold: {'GRABBED' if game.has_gold else 'SEARCHING'} | ")
-        output.append(f"Arrow: {'USED' if game.arrow_used else 'READY'} | ")
-        output.append(f"Wumpus: {'DEAD' if not game.wumpus_alive else 'ALIVE'}\n")
-        output.append("-" * 70 + "\n")
-        
-        if game.message:
-            output.append(f">>> {game.message}\n")
-        output.append("-" * 70 + "\n")
+        output.append(_status_block(game))
     
     return "".join(output)
 
 
 def show_menu():
+    """Return the menu text, building it only on first use"""
+    global _menu_text
+    if _menu_text is None:
+        _menu_text = _build_menu()
+    return _menu_text
+
+
+def _build_menu():
     menu = []
     menu.append("\n" * 2)
     menu.append("=" * 70 + "\n")
@@ -459,21 +535,42 @@ def show_menu():
     return "".join(menu)
 
 
+def _run_move(game, params):
+    dx, dy = params
+    direction = get_direction_name(dx, dy)
+    print(f"[Move {game.move_count}] -> Direction: {direction}")
+    game.move(dx, dy)
+
+
+def _run_grab(game, params):
+    print(f"[Move {game.move_count}] -> Action: GRAB GOLD - WIN!")
+    game.grab_gold()
+
+
+def _run_fire(game, params):
+    dx, dy = params
+    direction = get_direction_name(dx, dy)
+    print(f"[Move {game.move_count}] -> Action: FIRE ARROW ({direction})")
+    game.fire_arrow(dx, dy)
+
+
+# AI action name -> handler; unknown actions (e.g. 'wait') do nothing
+AI_ACTIONS = {
+    'move': _run_move,
+    'grab': _run_grab,
+    'fire': _run_fire
+}
+
+
 def main():
-    difficulty_levels = {
-        1: 4,
-        2: 8,
-        3: 16
-    }
+    menu_text = show_menu()
     
     while True:
-        menu_text = show_menu()
-        
         while True:
             try:
                 choice = int(input(menu_text + "\nChoice (1/2/3): "))
-                if choice in difficulty_levels:
-                    grid_size = difficulty_levels[choice]
+                if choice in DIFFICULTY_LEVELS:
+                    grid_size = DIFFICULTY_LEVELS[choice]
                     break
             except ValueError:
                 pass
@@ -498,19 +595,9 @@ def main():
             action, params = game.ai_agent.get_next_move()
             game.move_count += 1
             
-            if action == 'move':
-                dx, dy = params
-                direction = get_direction_name(dx, dy)
-                print(f"[Move {game.move_count}] -> Direction: {direction}")
-                game.move(dx, dy)
-            elif action == 'grab':
-                print(f"[Move {game.move_count}] -> Action: GRAB GOLD - WIN!")
-                game.grab_gold()
-            elif action == 'fire':
-                dx, dy = params
-                direction = get_direction_name(dx, dy)
-                print(f"[Move {game.move_count}] -> Action: FIRE ARROW ({direction})")
-                game.fire_arrow(dx, dy)
+            handler = AI_ACTIONS.get(action)
+            if handler:
+                handler(game, params)
             
             time.sleep(0.5)
         